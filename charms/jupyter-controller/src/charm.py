@@ -23,10 +23,11 @@ from ops.main import main
 from ops.model import ActiveStatus, MaintenanceStatus, ModelError, WaitingStatus
 from ops.pebble import CheckStatus, Layer
 
-METRICS_PORT = "8080"
+METRICS_PORT = 8080
 METRICS_PATH = "/metrics"
-PROBE_PORT = "8081"
+PROBE_PORT = 8081
 PROBE_PATH = "/healthz"
+PROBE_URL = f"http://localhost:{PROBE_PORT}{PROBE_PATH}"
 
 K8S_RESOURCE_FILES = [
     "src/templates/auth_manifests.yaml.j2",
@@ -60,8 +61,9 @@ class JupyterController(CharmBase):
         }
         self._k8s_resource_handler = None
         self._crd_resource_handler = None
+        self._generic_resources_loaded = False
 
-        metrics_port = ServicePort(int(METRICS_PORT), name="metrics-port")
+        metrics_port = ServicePort(METRICS_PORT, name="metrics-port")
         self.service_patcher = KubernetesServicePatch(
             self,
             [metrics_port],
@@ -84,8 +86,9 @@ class JupyterController(CharmBase):
 
         # setup events to be handled by main event handler
         self.framework.observe(self.on.config_changed, self._on_event)
+        self.framework.observe(self.on.leader_elected, self._on_event)
         self.framework.observe(self.on.jupyter_controller_pebble_ready, self._on_event)
-        for rel in self.model.relations.keys():
+        for rel in self.meta.relations:
             self.framework.observe(self.on[rel].relation_changed, self._on_event)
 
         # setup events to be handled by specific event handlers
@@ -109,12 +112,13 @@ class JupyterController(CharmBase):
                 context=self._context,
                 logger=self.logger,
             )
-        load_in_cluster_generic_resources(self._k8s_resource_handler.lightkube_client)
+        self._load_generic_resources(self._k8s_resource_handler.lightkube_client)
         return self._k8s_resource_handler
 
     @k8s_resource_handler.setter
     def k8s_resource_handler(self, handler: KubernetesResourceHandler):
         self._k8s_resource_handler = handler
+        self._generic_resources_loaded = False
 
     @property
     def crd_resource_handler(self):
@@ -126,12 +130,23 @@ class JupyterController(CharmBase):
                 context=self._context,
                 logger=self.logger,
             )
-        load_in_cluster_generic_resources(self._crd_resource_handler.lightkube_client)
+        self._load_generic_resources(self._crd_resource_handler.lightkube_client)
         return self._crd_resource_handler
 
     @crd_resource_handler.setter
     def crd_resource_handler(self, handler: KubernetesResourceHandler):
         self._crd_resource_handler = handler
+        self._generic_resources_loaded = False
+
+    def _load_generic_resources(self, client):
+        """Load in-cluster generic resources, once per charm instance.
+
+        Generic resources are registered globally in lightkube, so a single discovery is enough
+        for both resource handlers.
+        """
+        if not self._generic_resources_loaded:
+            load_in_cluster_generic_resources(client)
+            self._generic_resources_loaded = True
 
     @property
     def service_environment(self):
@@ -142,7 +157,7 @@ class JupyterController(CharmBase):
             "CULL_IDLE_TIME": config["cull-idle-time"],
             "IDLENESS_CHECK_PERIOD": config["idleness-check-period"],
             "USE_ISTIO": config["use-istio"],
-            "ISTIO_GATEWAY": f"{self.model.name}/kubeflow-gateway",
+            "ISTIO_GATEWAY": f"{self._namespace}/kubeflow-gateway",
             "ISTIO_HOST": "*",
             "ENABLE_CULLING": config["enable-culling"],
         }
@@ -171,7 +186,7 @@ class JupyterController(CharmBase):
                     "period": "30s",
                     "timeout": "20s",
                     "threshold": 4,
-                    "http": {"url": f"http://localhost:{PROBE_PORT}{PROBE_PATH}"},
+                    "http": {"url": PROBE_URL},
                 }
             },
         }
@@ -233,10 +248,9 @@ class JupyterController(CharmBase):
     def _check_status(self):
         """Check status of workload and set status accordingly."""
         self._check_leader()
-        container = self.unit.get_container(self._container_name)
-        if container:
+        if self.container:
             try:
-                check = container.get_check("jupyter-controller-up")
+                check = self.container.get_check("jupyter-controller-up")
             except ModelError as error:
                 raise GenericCharmRuntimeError(
                     "Failed to run health check on workload container"
@@ -263,17 +277,19 @@ class JupyterController(CharmBase):
         """Remove all resources."""
         delete_error = None
         self.unit.status = MaintenanceStatus("Removing K8S resources")
-        k8s_resources_manifests = self.k8s_resource_handler.render_manifests()
-        crd_resources_manifests = self.crd_resource_handler.render_manifests()
+        k8s_resource_handler = self.k8s_resource_handler
+        crd_resource_handler = self.crd_resource_handler
+        k8s_resources_manifests = k8s_resource_handler.render_manifests()
+        crd_resources_manifests = crd_resource_handler.render_manifests()
         try:
-            delete_many(self.k8s_resource_handler.lightkube_client, k8s_resources_manifests)
+            delete_many(k8s_resource_handler.lightkube_client, k8s_resources_manifests)
         except ApiError as error:
             # do not log/report when resources were not found
             if error.status.code != 404:
                 self.logger.error(f"Failed to delete CRD resources, with error: {error}")
                 delete_error = error
         try:
-            delete_many(self.crd_resource_handler.lightkube_client, crd_resources_manifests)
+            delete_many(crd_resource_handler.lightkube_client, crd_resources_manifests)
         except ApiError as error:
             # do not log/report when resources were not found
             if error.status.code != 404:
@@ -289,6 +305,7 @@ class JupyterController(CharmBase):
         """Update status actions."""
         self._on_event(_)
         try:
+            self._check_container_connection()
             self._check_status()
         except ErrorWithStatus as err:
             self.model.unit.status = err.status
@@ -3,6 +3,7 @@
 
 """Integration tests for Jupyter controller."""
 
+import asyncio
 import logging
 from pathlib import Path
 
@@ -21,12 +22,13 @@ from httpx import HTTPStatusError
 from lightkube import ApiError, Client
 from lightkube.generic_resource import create_namespaced_resource
 from lightkube.resources.apiextensions_v1 import CustomResourceDefinition
-from lightkube.resources.core_v1 import Namespace, Service
+from lightkube.resources.core_v1 import Service
 from pytest_operator.plugin import OpsTest
 
 log = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+METADATA = yaml.load(Path("./metadata.yaml").read_text(), Loader=YAML_LOADER)
 APP_NAME = METADATA["name"]
 JUPYTER_UI = "jupyter-ui"
 JUPYTER_UI_CHANNEL = "latest/edge"
@@ -41,44 +43,65 @@ ISTIO_GATEWAY_APP_NAME = "istio-ingressgateway"
 ISTIO_GATEWAY_TRUST = True
 ISTIO_GATEWAY_CONFIG = {"kind": "ingress"}
 
+NOTEBOOK_RESOURCE = create_namespaced_resource(
+    group="kubeflow.org",
+    version="v1",
+    kind="notebook",
+    plural="notebooks",
+)
+
+
+@pytest.fixture(scope="module")
+def lightkube_client() -> Client:
+    """Return a lightkube client shared by the tests in this module."""
+    return Client()
+
 
 @pytest.mark.abort_on_fail
 async def test_build_and_deploy(ops_test: OpsTest):
     """Test build and deploy."""
-    # Deploy istio-operators first
-    await ops_test.model.deploy(
-        entity_url=ISTIO_PILOT,
-        channel=ISTIO_OPERATORS_CHANNEL,
-        config=ISTIO_PILOT_CONFIG,
-        trust=ISTIO_PILOT_TRUST,
-    )
-    await ops_test.model.deploy(
-        entity_url=ISTIO_GATEWAY,
-        application_name=ISTIO_GATEWAY_APP_NAME,
-        channel=ISTIO_OPERATORS_CHANNEL,
-        config=ISTIO_GATEWAY_CONFIG,
-        trust=ISTIO_GATEWAY_TRUST,
+    # Deploy istio-operators and jupyter-ui while the charm under test is being built
+    my_charm, *_ = await asyncio.gather(
+        ops_test.build_charm("."),
+        ops_test.model.deploy(
+            entity_url=ISTIO_PILOT,
+            channel=ISTIO_OPERATORS_CHANNEL,
+            config=ISTIO_PILOT_CONFIG,
+            trust=ISTIO_PILOT_TRUST,
+        ),
+        ops_test.model.deploy(
+            entity_url=ISTIO_GATEWAY,
+            application_name=ISTIO_GATEWAY_APP_NAME,
+            channel=ISTIO_OPERATORS_CHANNEL,
+            config=ISTIO_GATEWAY_CONFIG,
+            trust=ISTIO_GATEWAY_TRUST,
+        ),
+        ops_test.model.deploy(JUPYTER_UI, channel=JUPYTER_UI_CHANNEL, trust=JUPYTER_UI_TRUST),
     )
 
     await ops_test.model.integrate(ISTIO_PILOT, ISTIO_GATEWAY_APP_NAME)
-
-    await ops_test.model.wait_for_idle(
-        status="active",
-        raise_on_blocked=False,
-        raise_on_error=True,
-        timeout=300,
-    )
-    # Deploy jupyter-ui and relate to istio
-    await ops_test.model.deploy(JUPYTER_UI, channel=JUPYTER_UI_CHANNEL, trust=JUPYTER_UI_TRUST)
     await ops_test.model.integrate(JUPYTER_UI, ISTIO_PILOT)
-    await ops_test.model.wait_for_idle(apps=[JUPYTER_UI], status="active", timeout=60 * 15)
 
-    my_charm = await ops_test.build_charm(".")
     image_path = METADATA["resources"]["oci-image"]["upstream-source"]
     resources = {"oci-image": image_path}
     await ops_test.model.deploy(my_charm, resources=resources, trust=True)
-    await ops_test.model.wait_for_idle(
-        status="active", raise_on_blocked=False, raise_on_error=False
+
+    # Wait for all applications in parallel, failing fast if a dependency errors
+    await asyncio.gather(
+        ops_test.model.wait_for_idle(
+            apps=[ISTIO_PILOT, ISTIO_GATEWAY_APP_NAME, JUPYTER_UI],
+            status="active",
+            raise_on_blocked=False,
+            raise_on_error=True,
+            timeout=60 * 15,
+        ),
+        ops_test.model.wait_for_idle(
+            apps=[APP_NAME],
+            status="active",
+            raise_on_blocked=False,
+            raise_on_error=False,
+            timeout=60 * 15,
+        ),
     )
 
     assert ops_test.model.applications[APP_NAME].units[0].workload_status == "active"
@@ -114,17 +137,9 @@ async def test_logging(ops_test):
     await assert_logging(app)
 
 
-# Helper to retry calling a function over 30 seconds for 10 attempts
-retry_for_5_attempts = tenacity.Retrying(
-    stop=(tenacity.stop_after_attempt(10) | tenacity.stop_after_delay(30)),
-    wait=tenacity.wait_exponential(multiplier=1, min=1, max=10),
-    reraise=True,
-)
-
-
 @tenacity.retry(
-    wait=tenacity.wait_exponential(multiplier=2, min=1, max=10),
-    stop=tenacity.stop_after_attempt(30),
+    wait=tenacity.wait_exponential_jitter(initial=1, max=10, jitter=2),
+    stop=(tenacity.stop_after_attempt(30) | tenacity.stop_after_delay(300)),
     reraise=True,
 )
 def assert_replicas(client, resource_class, resource_name, namespace):
@@ -144,26 +159,15 @@ def assert_replicas(client, resource_class, resource_name, namespace):
     assert replicas == 1, f"Waited too long for {resource_class_kind}/{resource_name}!"
 
 
-async def test_create_notebook(ops_test: OpsTest):
+async def test_create_notebook(ops_test: OpsTest, lightkube_client: Client):
     """Test notebook creation."""
-    lightkube_client = Client()
-    this_ns = lightkube_client.get(res=Namespace, name=ops_test.model.name)
-    lightkube_client.patch(res=Namespace, name=this_ns.metadata.name, obj=this_ns)
-
-    notebook_resource = create_namespaced_resource(
-        group="kubeflow.org",
-        version="v1",
-        kind="notebook",
-        plural="notebooks",
-        verbs=None,
-    )
     with open("examples/sample-notebook.yaml") as f:
-        notebook = notebook_resource(yaml.safe_load(f.read()))
+        notebook = NOTEBOOK_RESOURCE(yaml.load(f.read(), Loader=YAML_LOADER))
         lightkube_client.create(notebook, namespace=ops_test.model.name)
 
     try:
         notebook_ready = lightkube_client.get(
-            notebook_resource,
+            NOTEBOOK_RESOURCE,
             name="sample-notebook",
             namespace=ops_test.model.name,
         )
@@ -171,11 +175,11 @@ async def test_create_notebook(ops_test: OpsTest):
         assert False
     assert notebook_ready
 
-    assert_replicas(lightkube_client, notebook_resource, "sample-notebook", ops_test.model.name)
+    assert_replicas(lightkube_client, NOTEBOOK_RESOURCE, "sample-notebook", ops_test.model.name)
 
 
 @pytest.mark.abort_on_fail
-async def test_remove_with_resources_present(ops_test: OpsTest):
+async def test_remove_with_resources_present(ops_test: OpsTest, lightkube_client: Client):
     """Test remove with all resources deployed.
 
     Verify that all deployed resources that need to be removed are removed.
@@ -186,15 +190,14 @@ async def test_remove_with_resources_present(ops_test: OpsTest):
     assert APP_NAME not in ops_test.model.applications
 
     # verify that all resources that were deployed are removed
-    lightkube_client = Client()
-
     # verify all CRDs in namespace are removed
     crd_list = lightkube_client.list(
         CustomResourceDefinition,
         labels=[("app.juju.is/created-by", "jupyter-controller")],
         namespace=ops_test.model.name,
+        chunk_size=1,
     )
-    assert not list(crd_list)
+    assert next(iter(crd_list), None) is None
 
     # verify that Service is removed
     try:
@@ -209,15 +212,9 @@ async def test_remove_with_resources_present(ops_test: OpsTest):
             assert False
 
     # verify notebook is deleted
-    notebook_resource = create_namespaced_resource(
-        group="kubeflow.org",
-        version="v1",
-        kind="notebook",
-        plural="notebooks",
-    )
     try:
         _ = lightkube_client.get(
-            notebook_resource,
+            NOTEBOOK_RESOURCE,
             name="sample-notebook",
             namespace=ops_test.model.name,
         )
@@ -4,6 +4,7 @@
 """Unit tests for Jupyter controller."""
 
 import json
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,8 @@ from ops.testing import Harness
 
 from charm import JupyterController
 
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @pytest.fixture(scope="function")
 def harness() -> Harness:
@@ -104,20 +107,14 @@ class TestCharm:
 
         # load alert rules from rules files
         test_alerts = []
-        with open("src/prometheus_alert_rules/controller.rule") as f:
-            file_alert = yaml.safe_load(f.read())
-            test_alerts.append(file_alert["alert"])
-        with open("src/prometheus_alert_rules/host_resources.rules") as f:
-            file_alert = yaml.safe_load(f.read())
-            # there 2 alert rules in host_resources.rules
-            for rule in file_alert["groups"][0]["rules"]:
-                test_alerts.append(rule["alert"])
-        with open("src/prometheus_alert_rules/model_errors.rule") as f:
-            file_alert = yaml.safe_load(f.read())
-            test_alerts.append(file_alert["alert"])
-        with open("src/prometheus_alert_rules/unit_unavailable.rule") as f:
-            file_alert = yaml.safe_load(f.read())
-            test_alerts.append(file_alert["alert"])
+        for rules_file in Path("src/prometheus_alert_rules").glob("*.rule*"):
+            file_alert = yaml.load(rules_file.read_text(), Loader=YAML_LOADER)
+            if "groups" in file_alert:
+                # rules files can hold several alert rules, e.g. host_resources.rules
+                for group in file_alert["groups"]:
+                    test_alerts.extend(rule["alert"] for rule in group["rules"])
+            else:
+                test_alerts.append(file_alert["alert"])
 
         # alert rules
         alert_rules = json.loads(
@@ -126,18 +123,13 @@ class TestCharm:
         assert alert_rules is not None
         assert alert_rules["groups"] is not None
 
-        # there are 5 alerts
-        rules = []
-        for group in alert_rules["groups"]:
-            for rule in group["rules"]:
-                rules.append(rule)
+        rules = [rule["alert"] for group in alert_rules["groups"] for rule in group["rules"]]
 
         # verify number of alerts is the same in relation and in the rules file
         assert len(rules) == len(test_alerts)
 
         # verify alerts in relation match alerts in the rules file
-        for rule in rules:
-            assert rule["alert"] in test_alerts
+        assert set(rules) == set(test_alerts)
 
     @patch("charm.KubernetesServicePatch", lambda *_, **__: None)
     @patch("charm.JupyterController.k8s_resource_handler")
@@ -187,21 +179,83 @@ class TestCharm:
         k8s_resource_handler.apply.assert_called()
         assert isinstance(harness.charm.model.unit.status, MaintenanceStatus)
 
+    @patch("charm.KubernetesServicePatch", lambda *_, **__: None)
+    @patch("charm.KubernetesResourceHandler")
+    @patch("charm.load_in_cluster_generic_resources")
+    def test_generic_resources_loaded_once(
+        self,
+        load_in_cluster_generic_resources: MagicMock,
+        _: MagicMock,
+        harness: Harness,
+    ):
+        """Test generic resources are loaded once, not on every handler access."""
+        harness.begin()
+        for _ in range(2):
+            harness.charm.k8s_resource_handler
+            harness.charm.crd_resource_handler
+        load_in_cluster_generic_resources.assert_called_once()
+
+        # injecting a new handler triggers discovery again, exactly once
+        harness.charm.k8s_resource_handler = MagicMock()
+        harness.charm.k8s_resource_handler
+        harness.charm.k8s_resource_handler
+        assert load_in_cluster_generic_resources.call_count == 2
+
     @patch("charm.KubernetesServicePatch", lambda *_, **__: None)
     @patch("charm.JupyterController._apply_k8s_resources")
     @patch("charm.JupyterController._check_status")
     def test_update_status(
         self,
-        _apply_k8s_resources: MagicMock,
         _check_status: MagicMock,
+        _apply_k8s_resources: MagicMock,
         harness: Harness,
     ):
         """Test update status handler."""
         harness.set_leader(True)
         harness.begin_with_initial_hooks()
         harness.container_pebble_ready("jupyter-controller")
+        _apply_k8s_resources.reset_mock()
 
-        # test successful update status
+        # test successful update status, which also repairs drift in K8S resources
         harness.charm.on.update_status.emit()
         _apply_k8s_resources.assert_called()
         _check_status.assert_called()
+
+    @patch("charm.KubernetesServicePatch", lambda *_, **__: None)
+    @patch("charm.JupyterController.k8s_resource_handler")
+    @patch("charm.JupyterController.crd_resource_handler")
+    def test_leader_elected_after_pebble_ready(
+        self,
+        crd_resource_handler: MagicMock,
+        k8s_resource_handler: MagicMock,
+        harness: Harness,
+    ):
+        """Test that a unit becoming leader after pebble-ready is set up."""
+        harness.begin_with_initial_hooks()
+        harness.container_pebble_ready("jupyter-controller")
+        assert harness.charm.model.unit.status == WaitingStatus("Waiting for leadership")
+        assert not harness.get_container_pebble_plan("jupyter-controller").services
+
+        harness.set_leader(True)
+        k8s_resource_handler.apply.assert_called()
+        assert (
+            "jupyter-controller"
+            in harness.get_container_pebble_plan("jupyter-controller").services
+        )
+        assert harness.charm.model.unit.status == ActiveStatus()
+
+    @patch("charm.KubernetesServicePatch", lambda *_, **__: None)
+    @patch("charm.JupyterController._check_status")
+    def test_update_status_container_not_ready(
+        self,
+        _check_status: MagicMock,
+        harness: Harness,
+    ):
+        """Test update status waits for the container before checking its health."""
+        harness.set_leader(True)
+        harness.set_can_connect("jupyter-controller", False)
+        harness.begin()
+
+        harness.charm.on.update_status.emit()
+        _check_status.assert_not_called()
+        assert harness.charm.model.unit.status == MaintenanceStatus("Pod startup is not complete")
@@ -62,6 +62,10 @@ DEFAULT_WITH_OPTIONS_CONFIGS = [
     TOLERATIONS_OPTIONS_CONFIG,
     AFFINITY_OPTIONS_CONFIG,
 ]
+# use the libyaml-backed loader and dumper when available, they are much faster than the
+# pure-Python ones
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
 
 
 class CheckFailed(Exception):
@@ -69,10 +73,7 @@ class CheckFailed(Exception):
 
     def __init__(self, msg, status_type=None):
         """Raise this exception if one of the checks in main fails."""
-        super().__init__()
-
-        self.msg = msg
-        self.status_type = status_type
+        super().__init__(msg)
         self.status = status_type(msg)
 
 
@@ -106,6 +107,7 @@ class JupyterUI(CharmBase):
             "service": self._name,
         }
         self._k8s_resource_handler = None
+        self._generic_resources_loaded = False
 
         http_port = ServicePort(int(self._http_port), name="http")
         self.service_patcher = KubernetesServicePatch(
@@ -151,12 +153,19 @@ class JupyterUI(CharmBase):
                 context=self._context,
                 logger=self.logger,
             )
-        load_in_cluster_generic_resources(self._k8s_resource_handler.lightkube_client)
+        self._load_generic_resources(self._k8s_resource_handler.lightkube_client)
         return self._k8s_resource_handler
 
     @k8s_resource_handler.setter
     def k8s_resource_handler(self, handler: KubernetesResourceHandler):
         self._k8s_resource_handler = handler
+        self._generic_resources_loaded = False
+
+    def _load_generic_resources(self, client):
+        """Load in-cluster generic resources, once per charm instance."""
+        if not self._generic_resources_loaded:
+            load_in_cluster_generic_resources(client)
+            self._generic_resources_loaded = True
 
     def _get_env_vars(self):
         """Return environment variables based on model configuration."""
@@ -223,8 +232,8 @@ class JupyterUI(CharmBase):
         splits it into files as expected by the workload,
         and pushes the files to the container.
         """
-        for file_name, file_content in yaml.safe_load(
-            Path("src/logos-configmap.yaml").read_text()
+        for file_name, file_content in yaml.load(
+            Path("src/logos-configmap.yaml").read_text(), Loader=YAML_LOADER
         )["data"].items():
             logo_file = "/src/apps/default/static/assets/logos/" + file_name
             self.container.push(
@@ -270,7 +279,7 @@ class JupyterUI(CharmBase):
         """
         error_message = f"Cannot parse list input from config '{key}` - ignoring this input."
         try:
-            options = yaml.safe_load(self.model.config[key])
+            options = yaml.load(self.model.config[key], Loader=YAML_LOADER)
 
             # Empty yaml string, which resolves to None, should be treated as an empty list
             if options is None:
@@ -308,10 +317,11 @@ class JupyterUI(CharmBase):
             .default: the option selected by f'{key}-default'
         """
         default_key = f"{key}-default"
+        config = self.model.config
         try:
-            default = self.model.config[default_key]
-            options = self.model.config[key]
-            options = yaml.safe_load(options)
+            default = config[default_key]
+            options = config[key]
+            options = yaml.load(options, Loader=YAML_LOADER)
             # Convert anything empty to an empty list
             if not options:
                 options = []
@@ -421,12 +431,13 @@ class JupyterUI(CharmBase):
 
     def _configure_mesh(self, interfaces):
         if interfaces["ingress"]:
+            config = self.model.config
             interfaces["ingress"].send_data(
                 {
-                    "prefix": self.model.config["url-prefix"] + "/",
+                    "prefix": config["url-prefix"] + "/",
                     "rewrite": "/",
-                    "service": self.model.app.name,
-                    "port": self.model.config["port"],
+                    "service": self._name,
+                    "port": config["port"],
                 }
             )
 
@@ -479,7 +490,7 @@ def _to_yaml(data: str) -> str:
 
     This is used in the jinja template to format the yaml in the template.
     """
-    return yaml.safe_dump(data)
+    return yaml.dump(data, Dumper=YAML_DUMPER)
 
 
 if __name__ == "__main__":
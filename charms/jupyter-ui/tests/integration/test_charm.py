@@ -22,8 +22,9 @@ from pytest_operator.plugin import OpsTest
 
 logger = logging.getLogger(__name__)
 
-METADATA = yaml.safe_load(Path("./metadata.yaml").read_text())
-CONFIG = yaml.safe_load(Path("./config.yaml").read_text())
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+METADATA = yaml.load(Path("./metadata.yaml").read_text(), Loader=YAML_LOADER)
+CONFIG = yaml.load(Path("./config.yaml").read_text(), Loader=YAML_LOADER)
 APP_NAME = "jupyter-ui"
 JUPYTER_IMAGES_CONFIG = "jupyter-images"
 VSCODE_IMAGES_CONFIG = "vscode-images"
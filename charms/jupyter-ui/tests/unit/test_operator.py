@@ -298,6 +298,21 @@ class TestCharm:
         k8s_resource_handler.apply.assert_called()
         assert isinstance(harness.charm.model.unit.status, MaintenanceStatus)
 
+    @patch("charm.KubernetesServicePatch", lambda x, y, service_name: None)
+    @patch("charm.KubernetesResourceHandler", MagicMock)
+    @patch("charm.load_in_cluster_generic_resources")
+    def test_generic_resources_loaded_once(
+        self,
+        load_in_cluster_generic_resources: MagicMock,
+        harness: Harness,
+    ):
+        """Test generic resources are loaded once across main() runs."""
+        harness.set_leader(True)
+        harness.begin()
+        harness.charm.main(None)
+        harness.charm.main(None)
+        load_in_cluster_generic_resources.assert_called_once()
+
     @pytest.mark.parametrize(
         "config_key,expected_config_yaml",
         [
@@ -1,12 +1,12 @@
-import json
+import asyncio
 import logging
 from pathlib import Path
 from random import choices
 from string import ascii_lowercase
 from time import sleep
 
+import httpx
 import pytest
-import requests
 import tenacity
 import yaml
 from lightkube import Client
@@ -23,8 +23,11 @@ logger = logging.getLogger(__name__)
 
 CONTROLLER_PATH = Path("charms/jupyter-controller")
 UI_PATH = Path("charms/jupyter-ui")
-CONTROLLER_METADATA = yaml.safe_load(Path(f"{CONTROLLER_PATH}/metadata.yaml").read_text())
-UI_METADATA = yaml.safe_load(Path(f"{UI_PATH}/metadata.yaml").read_text())
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+CONTROLLER_METADATA = yaml.load(
+    Path(f"{CONTROLLER_PATH}/metadata.yaml").read_text(), Loader=YAML_LOADER
+)
+UI_METADATA = yaml.load(Path(f"{UI_PATH}/metadata.yaml").read_text(), Loader=YAML_LOADER)
 CONTROLLER_APP_NAME = CONTROLLER_METADATA["name"]
 UI_APP_NAME = UI_METADATA["name"]
 PROFILE_NAME = "kubeflow-user"
@@ -104,18 +107,20 @@ async def test_build_and_deploy(ops_test, lightkube_client, dummy_resources_for_
     ui_image_path = UI_METADATA["resources"]["oci-image"]["upstream-source"]
 
     # Deploy istio-operators first
-    await ops_test.model.deploy(
-        entity_url=ISTIO_PILOT,
-        channel=ISTIO_OPERATORS_CHANNEL,
-        config=ISTIO_PILOT_CONFIG,
-        trust=ISTIO_PILOT_TRUST,
-    )
-    await ops_test.model.deploy(
-        entity_url=ISTIO_GATEWAY,
-        application_name=ISTIO_GATEWAY_APP_NAME,
-        channel=ISTIO_OPERATORS_CHANNEL,
-        config=ISTIO_GATEWAY_CONFIG,
-        trust=ISTIO_GATEWAY_TRUST,
+    await asyncio.gather(
+        ops_test.model.deploy(
+            entity_url=ISTIO_PILOT,
+            channel=ISTIO_OPERATORS_CHANNEL,
+            config=ISTIO_PILOT_CONFIG,
+            trust=ISTIO_PILOT_TRUST,
+        ),
+        ops_test.model.deploy(
+            entity_url=ISTIO_GATEWAY,
+            application_name=ISTIO_GATEWAY_APP_NAME,
+            channel=ISTIO_OPERATORS_CHANNEL,
+            config=ISTIO_GATEWAY_CONFIG,
+            trust=ISTIO_GATEWAY_TRUST,
+        ),
     )
 
     await ops_test.model.add_relation(
@@ -349,27 +354,28 @@ async def test_prometheus_grafana_integration(ops_test):
     ]
     logger.info(f"Prometheus available at http://{prometheus_unit_ip}:9090")
 
-    for attempt in retry_for_5_attempts:
-        logger.info(
-            f"Testing prometheus deployment (attempt " f"{attempt.retry_state.attempt_number})"
-        )
-        with attempt:
-            r = requests.get(
-                f'http://{prometheus_unit_ip}:9090/api/v1/query?'
-                f'query=up{{juju_application="{CONTROLLER_APP_NAME}"}}'
+    async with httpx.AsyncClient() as client:
+        async for attempt in retry_for_5_attempts:
+            logger.info(
+                f"Testing prometheus deployment (attempt " f"{attempt.retry_state.attempt_number})"
             )
-            response = json.loads(r.content.decode("utf-8"))
-            response_status = response["status"]
-            logger.info(f"Response status is {response_status}")
-            assert response_status == "success"
+            with attempt:
+                r = await client.get(
+                    f'http://{prometheus_unit_ip}:9090/api/v1/query',
+                    params={"query": f'up{{juju_application="{CONTROLLER_APP_NAME}"}}'},
+                )
+                response = r.json()
+                response_status = response["status"]
+                logger.info(f"Response status is {response_status}")
+                assert response_status == "success"
 
-            response_metric = response["data"]["result"][0]["metric"]
-            assert response_metric["juju_application"] == CONTROLLER_APP_NAME
-            assert response_metric["juju_model"] == ops_test.model_name
+                response_metric = response["data"]["result"][0]["metric"]
+                assert response_metric["juju_application"] == CONTROLLER_APP_NAME
+                assert response_metric["juju_model"] == ops_test.model_name
 
 
 # Helper to retry calling a function over 30 seconds or 5 attempts
-retry_for_5_attempts = tenacity.Retrying(
+retry_for_5_attempts = tenacity.AsyncRetrying(
     stop=(tenacity.stop_after_attempt(5) | tenacity.stop_after_delay(30)),
     wait=tenacity.wait_exponential(multiplier=1, min=1, max=10),
     reraise=True,